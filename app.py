@@ -8,15 +8,33 @@ using the Pythagorean numerology system.
 import streamlit as st
 import json
 import os
+import tempfile
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from numerology import (
-    calculate_numerology_value, 
+    NameScore,
     get_numerology_meaning, 
+    score_name,
     validate_name_input
 )
 
+# Optional faster JSON encoding and parsing for history files; the standard library is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Constants
-HISTORY_FILE = "calculation_history.json"
+HISTORY_FILE = "calculation_history.jsonl"
+LEGACY_HISTORY_FILE = "calculation_history.json"
+HISTORY_PAGE_SIZE = 50
+
+def _init_state(defaults: dict):
+    """Set session state defaults for keys that are not initialized yet."""
+    for key, value in defaults.items():
+        st.session_state.setdefault(key, value)
+
 
 def setup_page():
     """Set up the page configuration and display header."""
@@ -28,14 +46,11 @@ def setup_page():
     )
     
     # Initialize session state variables
-    if "history_filter" not in st.session_state:
-        st.session_state["history_filter"] = []
-    
-    # Initialize name variables
-    if "first_name" not in st.session_state:
-        st.session_state["first_name"] = ""
-    if "last_name" not in st.session_state:
-        st.session_state["last_name"] = ""
+    _init_state({
+        "history_filter": [],
+        "first_name": "",
+        "last_name": ""
+    })
     
     st.title("🔢 Numerology Calculator")
     st.markdown("---")
@@ -49,7 +64,13 @@ def setup_page():
     )
 
 
-def display_results(name: str, numerology_value: int, meaning: str):
+@lru_cache(maxsize=None)
+def _meaning_block(value: int) -> str:
+    """Format the meaning line for a numerology value; there are only 12 distinct outputs."""
+    return f"**Meaning:** {get_numerology_meaning(value)}"
+
+
+def display_results(name: str, numerology_value: int):
     """Display the calculation results."""
     st.success("✅ Calculation Complete!")
     
@@ -62,7 +83,7 @@ def display_results(name: str, numerology_value: int, meaning: str):
         )
     
     with col2:
-        st.info(f"**Meaning:** {meaning}")
+        st.info(_meaning_block(numerology_value))
     
     st.markdown("---")
     with st.expander("🔍 How is this calculated?"):
@@ -88,44 +109,82 @@ def display_results(name: str, numerology_value: int, meaning: str):
         )
 
 
-def process_calculation(full_name: str):
-    """Process the numerology calculation for the full name."""
+def process_calculation(full_name: str) -> bool:
+    """
+    Process the numerology calculation for the full name and save it to history.
+    
+    A saved result is not rendered here: the caller reruns the app so the new
+    entry also appears in the history, and display_calculation renders the
+    result kept in session state once, after that rerun. A result that was not
+    saved is rendered right away.
+    
+    Args:
+        full_name (str): The name to calculate
+        
+    Returns:
+        bool: True if the calculation was saved to history
+    """
     is_valid, error_message = validate_name_input(full_name)
     
     if not is_valid:
         st.error(f"❌ {error_message}")
-        return
+        return False
     
     try:
-        # Calculate based on the combined name
-        numerology_value = calculate_numerology_value(full_name)
-        meaning = get_numerology_meaning(numerology_value)
-        
-        # Display the calculation results
-        display_results(full_name, numerology_value, meaning)
-        
-        # Show calculation steps and get the details
-        st.markdown("**Step-by-step Calculation:**")
-        calculation_details = show_calculation_steps(full_name, numerology_value)
+        # Score the name once; the same pass yields the value and the breakdown shown below
+        score = score_name(full_name)
         
         # Save to history (only if name is unique)
-        was_saved = save_to_history(full_name, numerology_value, meaning, calculation_details)
-        if was_saved:
-            st.success("✅ Calculation saved to history!")
+        meaning = get_numerology_meaning(score.value)
+        if save_to_history(full_name, score.value, meaning, build_calculation_details(score)):
+            st.session_state["_saved_result"] = (full_name, score)
+            return True
+        
+        display_calculation(full_name, score)
     except ValueError as e:
         st.error(f"❌ Error: {str(e)}")
     except Exception as e:
         st.error(f"❌ An unexpected error occurred: {str(e)}")
+    
+    return False
+
+
+def display_calculation(full_name: str, score: NameScore):
+    """Display the calculation results followed by the step-by-step calculation."""
+    display_results(full_name, score.value)
+    
+    st.markdown("**Step-by-step Calculation:**")
+    show_calculation_steps(score)
 
 
 def main():
     """Main function to run the Streamlit app."""
     setup_page()
     
-    # Display success message if history was just cleared
-    if 'history_cleared' in st.session_state and st.session_state['history_cleared']:
-        st.success("✅ History has been cleared successfully!")
-        st.session_state['history_cleared'] = False
+    # Input and results section; typing or calculating reruns only this fragment
+    _calc_fragment()
+    
+    st.markdown("---")
+    
+    # History section; filtering or paging reruns only this fragment
+    _history_fragment()
+    
+    st.markdown("---")
+    st.markdown(
+        """
+        <div style='text-align: center; color: #666; font-size: 0.8em;'>
+            Built with ❤️ using Streamlit | Pythagorean Numerology System
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+
+@st.fragment
+def _calc_fragment():
+    """Display the name inputs, the Calculate button and the calculation results."""
+    # Result saved by the previous run, which reran the whole app to refresh the history
+    saved_result = st.session_state.pop("_saved_result", None)
     
     # Input section
     st.subheader("Enter a Name")
@@ -151,13 +210,10 @@ def main():
     full_name = f"{first_name} {last_name}".strip()
     
     # Store the name parts in session state for later use
-    if 'first_name' not in st.session_state:
-        st.session_state['first_name'] = ''
-    if 'last_name' not in st.session_state:
-        st.session_state['last_name'] = ''
-        
-    st.session_state['first_name'] = first_name
-    st.session_state['last_name'] = last_name
+    if st.session_state.get('first_name') != first_name:
+        st.session_state['first_name'] = first_name
+    if st.session_state.get('last_name') != last_name:
+        st.session_state['last_name'] = last_name
     
     if st.button("Calculate Numerology Value", type="primary", key="calculate_button"):
         if not full_name:
@@ -168,102 +224,65 @@ def main():
         if handle_duplicate_name(full_name):
             # Name exists and was handled (either viewed or ignored)
             return
-        else:
-            # Process the calculation for new name
-            process_calculation(full_name)
-    
-    st.markdown("---")
-    
-    # History section
+        
+        # Process the calculation for new name; a saved entry must also appear in
+        # the history fragment, so rerun the whole app and show the result there
+        if process_calculation(full_name):
+            st.rerun()
+    elif saved_result and saved_result[0] == full_name:
+        display_calculation(*saved_result)
+        st.success("✅ Calculation saved to history!")
+
+
+@st.fragment
+def _history_fragment():
+    """Display the calculation history."""
     display_history()
-    
-    st.markdown("---")
-    st.markdown(
-        """
-        <div style='text-align: center; color: #666; font-size: 0.8em;'>
-            Built with ❤️ using Streamlit | Pythagorean Numerology System
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
 
 
-def show_calculation_steps(name: str, final_value: int):
+def show_calculation_steps(score: NameScore):
     """
-    Display the step-by-step calculation process and return the calculation details.
+    Display the step-by-step calculation process.
     
     Args:
-        name (str): The input name
-        final_value (int): The final numerology value
-        
-    Returns:
-        dict: Dictionary containing the calculation details
+        score (NameScore): The single-pass score of the input name
     """
-    letter_values = get_letter_values()
-    
     st.markdown("**Calculation Steps:**")
     
-    breakdown, total, ignored_chars = process_name_for_display(name, letter_values)
-    
-    calculation_details = {
-        "breakdown": breakdown,
-        "total": total,
-        "ignored_chars": ignored_chars,
-        "final_value": final_value
-    }
-    
-    if breakdown:
-        display_calculation_breakdown(breakdown, total, ignored_chars, final_value)
-        
-    return calculation_details
+    if score.breakdown:
+        display_calculation_breakdown(
+            score.breakdown, score.total, score.space_count, score.other_ws_count, score.value
+        )
 
 
-def get_letter_values() -> dict:
-    """Get the Pythagorean letter to number mapping."""
+def build_calculation_details(score: NameScore) -> dict:
+    """
+    Build the calculation details stored with a history entry.
+    
+    Args:
+        score (NameScore): The single-pass score of the input name
+        
+    Returns:
+        dict: Dictionary containing the calculation details
+    """
     return {
-        'A': 1, 'J': 1, 'S': 3,
-        'B': 2, 'K': 2, 'T': 4,
-        'C': 3, 'L': 3, 'U': 6,
-        'D': 4, 'M': 4, 'V': 6,
-        'E': 5, 'N': 5, 'W': 6,
-        'F': 8, 'O': 7, 'X': 5,
-        'G': 3, 'P': 8, 'Y': 1,
-        'H': 5, 'Q': 1, 'Z': 7,
-        'I': 1, 'R': 2
+        "breakdown": score.breakdown,
+        "total": score.total,
+        "ignored_chars_count": score.space_count + score.other_ws_count,
+        "final_value": score.value
     }
-    # Note: This maps the letters exactly as defined in numerology.py
-
-def process_name_for_display(name: str, letter_values: dict) -> tuple:
-    """Process name and return breakdown components."""
-    breakdown = []
-    total = 0
-    ignored_chars = []
-    
-    for char in name.upper():
-        if char in letter_values:
-            value = letter_values[char]
-            breakdown.append(f"{char} = {value}")
-            total += value
-        elif char.isspace():
-            ignored_chars.append(char)
-        elif char.isalpha():
-            breakdown.append(f"{char} = ?")
-    
-    return breakdown, total, ignored_chars
 
 
-def display_calculation_breakdown(breakdown: list, total: int, ignored_chars: list, final_value: int):
+def display_calculation_breakdown(breakdown: str, total: int, space_count: int, other_ws_count: int, final_value: int):
     """Display the calculation breakdown with ignored characters info."""
-    st.code(" + ".join(breakdown) + f" = {total}")
+    st.code(f"{breakdown} = {total}")
     
-    if ignored_chars:
-        space_count = len([c for c in ignored_chars if c == ' '])
-        other_count = len(ignored_chars) - space_count
+    if space_count or other_ws_count:
         ignored_msg = []
         if space_count > 0:
             ignored_msg.append(f"{space_count} space(s)")
-        if other_count > 0:
-            ignored_msg.append(f"{other_count} other whitespace character(s)")
+        if other_ws_count > 0:
+            ignored_msg.append(f"{other_ws_count} other whitespace character(s)")
         st.caption(f"Ignored: {', '.join(ignored_msg)}")
     
     if total != final_value:
@@ -272,7 +291,7 @@ def display_calculation_breakdown(breakdown: list, total: int, ignored_chars: li
 
 def save_to_history(name: str, numerology_value: int, meaning: str, calculation_details: dict = None):
     """
-    Save the calculation to history JSON file.
+    Append the calculation to the history JSON Lines file.
     
     Args:
         name (str): The full name that was calculated
@@ -288,16 +307,6 @@ def save_to_history(name: str, numerology_value: int, meaning: str, calculation_
         st.warning(f"⚠️ '{name}' is already in your calculation history. Duplicate entry not saved.")
         return False
     
-    # Load existing history or create new if not exists
-    if os.path.exists(HISTORY_FILE):
-        with open(HISTORY_FILE, "r") as f:
-            try:
-                history = json.load(f)
-            except json.JSONDecodeError:
-                history = []
-    else:
-        history = []
-        
     # Get first and last name components
     # First try from session state, then fall back to parsing the full name
     first_name = st.session_state.get('first_name', '')
@@ -322,66 +331,230 @@ def save_to_history(name: str, numerology_value: int, meaning: str, calculation_
     
     # Add calculation details if provided
     if calculation_details:
-        # Convert the breakdown list to a string for better storage
         calculation_summary = {
-            "breakdown": " + ".join(calculation_details["breakdown"]) if calculation_details.get("breakdown") else "",
+            "breakdown": calculation_details.get("breakdown", ""),
             "total": calculation_details.get("total", 0),
             "final_value": calculation_details.get("final_value", 0),
-            "ignored_chars_count": len(calculation_details.get("ignored_chars", []))
+            "ignored_chars_count": calculation_details.get("ignored_chars_count", 0)
         }
         new_entry["calculation"] = calculation_summary
     
-    # Add new entry
-    history.append(new_entry)
-    
-    # Save back to file
-    with open(HISTORY_FILE, "w") as f:
-        json.dump(history, f, indent=2)
+    # Append the new entry as a single line; existing entries are not rewritten
+    mtime_before = _history_mtime()
+    with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+        f.write(_encode_entry(new_entry))
+    _remember_history(new_entry, mtime_before)
     
     return True
 
 
-def load_history():
+def _encode_entry(entry) -> str:
+    """Serialize a history entry as one compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry).decode("utf-8") + "\n"
+    return json.dumps(entry, separators=(',', ':'), ensure_ascii=False) + "\n"
+
+
+def _decode_json(text: str):
+    """Parse JSON text; raises json.JSONDecodeError (orjson's error subclasses it) on bad input."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@st.cache_data(show_spinner=False)
+def _load_history_cached(path: str, mtime: float):
     """
-    Load calculation history from JSON file.
+    Read and parse a history file.
+    
+    The path and the file's modification time are the cache key, so the
+    parsed list is reused across reruns until the file actually changes.
     
+    Args:
+        path (str): Path of the JSON Lines history file
+        mtime (float): Modification time of the file (0.0 if missing)
+        
     Returns:
         list: List of calculation history entries
     """
-    if os.path.exists(HISTORY_FILE):
-        with open(HISTORY_FILE, "r") as f:
+    history = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = _decode_json(line)
+                except json.JSONDecodeError:
+                    # Skip a corrupt line (e.g. a torn write) instead of dropping the whole history
+                    continue
+                if not isinstance(entry, dict):
+                    # Valid JSON but not an entry (e.g. 5, [] or null); skip it for the same reason
+                    continue
+                history.append(_normalize_entry(entry))
+    except FileNotFoundError:
+        pass
+    return history
+
+
+@st.cache_resource(show_spinner=False)
+def _migrate_legacy_history():
+    """
+    Convert a legacy JSON array history file to the JSON Lines format.
+    
+    Cached with st.cache_resource, so it runs once per server process rather
+    than on every history read; a migration that raises is retried on the next
+    call. Runs only when LEGACY_HISTORY_FILE exists and HISTORY_FILE does not;
+    the legacy file is removed once its entries have been rewritten. A legacy
+    file that is not a JSON array of entries is renamed to a .bak file instead,
+    so its contents are kept and no HISTORY_FILE is created from it.
+    """
+    if not os.path.exists(LEGACY_HISTORY_FILE) or os.path.exists(HISTORY_FILE):
+        return
+    
+    try:
+        with open(LEGACY_HISTORY_FILE, "r", encoding="utf-8") as f:
             try:
-                return json.load(f)
+                history = _decode_json(f.read())
             except json.JSONDecodeError:
-                return []
-    else:
-        return []
+                history = None
+    except FileNotFoundError:
+        # Another session migrated it first
+        return
+    
+    if not isinstance(history, list) or not all(isinstance(entry, dict) for entry in history):
+        try:
+            os.replace(LEGACY_HISTORY_FILE, f"{LEGACY_HISTORY_FILE}.bak")
+        except FileNotFoundError:
+            pass
+        return
+    
+    # Write to a uniquely named temporary file and move it into place, so an
+    # interrupted migration leaves no partial HISTORY_FILE and is retried on the
+    # next load, and concurrent sessions never write to the same temporary file
+    fd, temp_file = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(HISTORY_FILE)),
+        prefix=f"{os.path.basename(HISTORY_FILE)}.",
+        suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for entry in history:
+                f.write(_encode_entry(entry))
+        os.replace(temp_file, HISTORY_FILE)
+    except Exception:
+        os.remove(temp_file)
+        raise
+    
+    try:
+        os.remove(LEGACY_HISTORY_FILE)
+    except FileNotFoundError:
+        # Another session finished the same migration first
+        pass
 
 
-def display_history_entry(entry):
+def _history_mtime() -> float:
+    """Return the modification time of HISTORY_FILE, or 0.0 if it does not exist."""
+    try:
+        return os.path.getmtime(HISTORY_FILE)
+    except FileNotFoundError:
+        return 0.0
+
+
+def _get_history():
     """
-    Display a single history entry as a card.
-    Compatible with both new format (first_name/last_name) and old format entries.
+    Get the calculation history, memoized in session state.
+    
+    The parsed list is reused for every call within and across reruns
+    until the history file's modification time changes.
+    
+    Returns:
+        list: List of calculation history entries
     """
-    # Create a local copy to avoid modifying the original entry
-    display_entry = entry.copy()
+    _migrate_legacy_history()
+    mtime = _history_mtime()
+    if "_history_cache" not in st.session_state or st.session_state.get("_history_mtime") != mtime:
+        history = _load_history_cached(HISTORY_FILE, mtime)
+        # Normalized name -> position of the first entry with that name
+        index = {}
+        for position, entry in enumerate(history):
+            index.setdefault(entry["_norm_key"], position)
+            index.setdefault(entry["_norm_combined"], position)
+        
+        st.session_state["_history_cache"] = history
+        st.session_state["_history_index"] = index
+        st.session_state["_history_values"] = sorted({entry["numerology_value"] for entry in history})
+        st.session_state["_history_mtime"] = mtime
+    return st.session_state["_history_cache"]
+
+
+def _get_history_index() -> dict:
+    """Get the mapping of normalized names to history positions, used for duplicate detection."""
+    _get_history()
+    return st.session_state["_history_index"]
+
+
+def _get_history_values() -> list:
+    """Get the sorted unique numerology values in history, used as filter options."""
+    _get_history()
+    return st.session_state["_history_values"]
+
+
+def _remember_history(new_entry, mtime_before: float):
+    """
+    Update the memoized history after new_entry was appended to the file.
+    
+    Reads session state directly: going through _get_history would see the
+    new mtime and re-read the whole file. If the file had already changed
+    since it was memoized (e.g. another session appended an entry), the memo
+    is dropped instead, so the next read picks up both entries.
     
-    # For backward compatibility: parse first and last names if not present
-    if "first_name" not in display_entry or "last_name" not in display_entry:
-        if "name" in display_entry:
-            first, last = parse_name_components(display_entry["name"])
-            display_entry["first_name"] = first
-            display_entry["last_name"] = last
+    Args:
+        new_entry (dict): The entry that was just appended
+        mtime_before (float): Modification time of the file just before the append
+    """
+    _load_history_cached.clear()
+    if st.session_state.get("_history_mtime") != mtime_before:
+        _forget_history()
+        return
+    
+    _normalize_entry(new_entry)
+    
+    history = st.session_state["_history_cache"]
+    index = st.session_state["_history_index"]
+    index.setdefault(new_entry["_norm_key"], len(history))
+    index.setdefault(new_entry["_norm_combined"], len(history))
+    history.append(new_entry)
     
+    values = st.session_state["_history_values"]
+    if new_entry["numerology_value"] not in values:
+        st.session_state["_history_values"] = sorted(values + [new_entry["numerology_value"]])
+    st.session_state["_history_mtime"] = _history_mtime()
+
+
+def _forget_history():
+    """Drop the memoized history so the next read goes back to the file."""
+    _load_history_cached.clear()
+    st.session_state.pop("_history_cache", None)
+    st.session_state.pop("_history_index", None)
+    st.session_state.pop("_history_values", None)
+    st.session_state.pop("_history_mtime", None)
+
+
+def display_history_entry(entry):
+    """
+    Display a single history entry as a card, used for the row selected in the history table.
+    Legacy entries get first_name/last_name from _normalize_entry at load time.
+    """
     with st.container():
         col1, col2 = st.columns([1, 2])
         
         with col1:
-            st.markdown(f"**Date:** {display_entry['timestamp']}")
+            st.markdown(f"**Date:** {entry['timestamp']}")
             
             # Display names based on what's available
-            first = display_entry.get("first_name", "").strip()
-            last = display_entry.get("last_name", "").strip()
+            first = entry.get("first_name", "").strip()
+            last = entry.get("last_name", "").strip()
             
             if first and last:
                 st.markdown(f"**First Name:** {first}")
@@ -391,93 +564,145 @@ def display_history_entry(entry):
             elif last:
                 st.markdown(f"**Last Name:** {last}")
             else:
-                st.markdown(f"**Name:** {display_entry['name']}")
+                st.markdown(f"**Name:** {entry['name']}")
                 
-            st.markdown(f"**Value:** {display_entry['numerology_value']}")
+            st.markdown(f"**Value:** {entry['numerology_value']}")
         
         with col2:
-            st.markdown(f"**Meaning:** {display_entry['meaning']}")
+            st.markdown(f"**Meaning:** {entry['meaning']}")
             
-            # Display calculation details if available
-            if "calculation" in display_entry:
-                display_calculation_history(display_entry["calculation"])
+            # Display calculation details if available (already inside the history expander)
+            if "calculation" in entry:
+                display_calculation_details(entry["calculation"])
         
         st.markdown("---")
 
 
 def display_calculation_history(calc):
-    """Display calculation details from history."""
+    """Display calculation details from history in an expander."""
     with st.expander("Show calculation"):
-        if calc.get("breakdown"):
-            st.code(f"{calc['breakdown']} = {calc['total']}")
+        display_calculation_details(calc)
+
+
+def display_calculation_details(calc):
+    """Display calculation details from history."""
+    if calc.get("breakdown"):
+        st.code(f"{calc['breakdown']} = {calc['total']}")
+    
+    if calc["total"] != calc["final_value"]:
+        st.write(f"Reduced: {calc['total']} → {calc['final_value']}")
         
-        if calc["total"] != calc["final_value"]:
-            st.write(f"Reduced: {calc['total']} → {calc['final_value']}")
-            
-        if calc.get("ignored_chars_count", 0) > 0:
-            st.caption(f"Ignored: {calc['ignored_chars_count']} whitespace character(s)")
+    if calc.get("ignored_chars_count", 0) > 0:
+        st.caption(f"Ignored: {calc['ignored_chars_count']} whitespace character(s)")
 
 
 def display_history():
     """Display the calculation history in the app."""
-    history = load_history()
+    history = _get_history()
     
     if not history:
         st.info("No calculation history yet.")
         return
     
-    st.subheader("Calculation History")
+    # Draw everything into one placeholder so clearing can blank it in this same run
+    history_area = st.empty()
+    cleared = False
     
-    # Create an expander for history
-    with st.expander("View Previous Calculations"):
-        # Show newest entries first
-        history.reverse()
-        
-        # Get all available numerology values for filtering (sorted list of unique values)
-        numerology_values = sorted(list({entry["numerology_value"] for entry in history}))
-        
-        # Add filter controls
-        st.write("**Filter by Numerology Value:**")
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            selected_values = st.multiselect(
-                label="Select values to display:",
-                options=numerology_values,
-                default=[],
-                key="history_filter"
-            )
+    with history_area.container():
+        st.subheader("Calculation History")
         
-        with col2:
-            if st.button("Clear Filter", key="clear_filter_button"):
-                # Reset the filter
-                st.session_state["history_filter"] = []
-                selected_values = []
-        
-        # Apply filter if selections were made
-        filtered_history = history
-        if selected_values:
-            filtered_history = [entry for entry in history if entry["numerology_value"] in selected_values]
-            st.write(f"Showing {len(filtered_history)} of {len(history)} entries")
-        
-        # Display message if no entries match the filter
-        if selected_values and not filtered_history:
-            st.info("No entries match your filter criteria.")
+        # Create an expander for history
+        with st.expander("View Previous Calculations"):
+            # Add filter controls
+            st.write("**Filter by Numerology Value:**")
+            col1, col2 = st.columns([3, 1])
             
-        # Display each history entry
-        for entry in filtered_history:
-            display_history_entry(entry)
-        
-        st.markdown("---")
-        
-        # Option to clear history
-        col1, _ = st.columns([1, 4])
-        with col1:
-            if st.button("Clear History", key="clear_history_button"):
-                if os.path.exists(HISTORY_FILE):
-                    os.remove(HISTORY_FILE)
-                    st.session_state['history_cleared'] = True
-                    st.rerun()
+            with col1:
+                selected_values = st.multiselect(
+                    label="Select values to display:",
+                    options=_get_history_values(),
+                    default=[],
+                    key="history_filter"
+                )
+            
+            with col2:
+                if st.button("Clear Filter", key="clear_filter_button"):
+                    # Reset the filter
+                    st.session_state["history_filter"] = []
+                    selected_values = []
+            
+            selected_set = frozenset(selected_values)
+            
+            if selected_set and selected_set.isdisjoint(_get_history_values()):
+                # No entry can match, so skip scanning the history
+                st.write(f"Showing 0 of {len(history)} entries")
+                st.info("No entries match your filter criteria.")
+            else:
+                # Apply filter if selections were made
+                filtered_history = history
+                if selected_set:
+                    filtered_history = [entry for entry in history if entry["numerology_value"] in selected_set]
+                    st.write(f"Showing {len(filtered_history)} of {len(history)} entries")
+                
+                # Display one page of entries, newest first, without reordering the memoized list.
+                # A single table replaces a container, columns and several markdowns per entry.
+                limit = st.session_state.get("history_limit", HISTORY_PAGE_SIZE)
+                page = list(islice(reversed(filtered_history), limit))
+                
+                # Streamlit keeps a keyed table's selected row index across data changes,
+                # so key the table on what is shown: a different page starts unselected
+                # instead of moving the card to whichever entry now sits at that index
+                newest = page[0]["timestamp"] if page else ""
+                table_key = f"history_table_{len(history)}_{sorted(selected_set)}_{limit}_{newest}"
+                table = st.dataframe(
+                    [
+                        {
+                            "Date": entry["timestamp"],
+                            "Name": entry["_display_name"],
+                            "Value": entry["numerology_value"],
+                            "Meaning": entry["meaning"]
+                        }
+                        for entry in page
+                    ],
+                    use_container_width=True,
+                    hide_index=True,
+                    on_select="rerun",
+                    selection_mode="single-row",
+                    key=table_key
+                )
+                
+                if len(filtered_history) > limit:
+                    st.caption(f"Showing the {limit} most recent of {len(filtered_history)} entries")
+                    if st.button("Load more", key="load_more_history_button"):
+                        st.session_state["history_limit"] = limit + HISTORY_PAGE_SIZE
+                        st.rerun(scope="fragment")
+                
+                # Show the full card only for the selected row
+                selected_rows = table.selection.rows
+                if selected_rows and selected_rows[0] < len(page):
+                    display_history_entry(page[selected_rows[0]])
+                else:
+                    st.caption("Select a row to show its calculation.")
+            
+            st.markdown("---")
+            
+            # Option to clear history
+            col1, _ = st.columns([1, 4])
+            with col1:
+                if st.button("Clear History", key="clear_history_button"):
+                    try:
+                        os.remove(HISTORY_FILE)
+                    except FileNotFoundError:
+                        # Already removed, e.g. from another session
+                        pass
+                    _forget_history()
+                    st.session_state.pop("history_limit", None)
+                    cleared = True
+    
+    if cleared:
+        history_area.empty()
+        st.success("✅ History has been cleared successfully!")
+        st.info("No calculation history yet.")
 
 
 def is_name_in_history(name: str) -> bool:
@@ -490,81 +715,65 @@ def is_name_in_history(name: str) -> bool:
     Returns:
         bool: True if name exists in history, False otherwise
     """
-    history = load_history()
-    name = name.lower().strip()
-    
-    # Case-insensitive search
-    for entry in history:
-        # Check against full name
-        if entry["name"].lower().strip() == name:
-            return True
-            
-        # Check against combined first and last name if they exist separately
-        if "first_name" in entry and "last_name" in entry:
-            combined = f"{entry.get('first_name', '')} {entry.get('last_name', '')}".lower().strip()
-            if combined == name:
-                return True
-    
-    return False
+    # Case-insensitive match against full names and combined first/last names
+    return name.lower().strip() in _get_history_index()
 
 
 def get_display_name(entry):
     """
     Helper function to get the appropriate display name from an entry.
-    Works with both new format (first_name/last_name) and old format entries.
+    The name is precomputed by _normalize_entry when history is loaded.
     """
-    # For entries with separated first and last name fields
-    if "first_name" in entry and "last_name" in entry:
-        first = entry.get("first_name", "").strip()
-        last = entry.get("last_name", "").strip()
-        
-        if first and last:
-            return f"{first} {last}"
-        elif first:
-            return first
-        elif last:
-            return last
-            
-    # For entries with only the full name
-    if "name" in entry and entry["name"]:
-        return entry["name"].strip()
+    return entry["_display_name"]
+
+
+def _normalize_entry(entry):
+    """
+    Precompute the name fields that rendering and duplicate detection read
+    from a history entry. Legacy entries without first_name/last_name get
+    them parsed from the full name.
+    
+    Args:
+        entry (dict): A history entry, updated in place
         
-    # Fallback
-    return "Unknown"
+    Returns:
+        dict: The same entry
+    """
+    if "first_name" not in entry or "last_name" not in entry:
+        entry["first_name"], entry["last_name"] = parse_name_components(entry.get("name", ""))
+    
+    # Prefer the separated first and last names, then the full name
+    display_name = f"{entry['first_name'].strip()} {entry['last_name'].strip()}".strip()
+    entry["_display_name"] = display_name or entry.get("name", "").strip() or "Unknown"
+    
+    # Lowercased keys matched case-insensitively against entered names
+    entry["_norm_key"] = entry.get("name", "").lower().strip()
+    entry["_norm_combined"] = f"{entry['first_name']} {entry['last_name']}".lower().strip()
+    return entry
 
 def display_existing_calculation(entry):
     """
     Display an existing calculation entry.
-    Compatible with both new format (first_name/last_name) and old format entries.
+    Legacy entries get first_name/last_name from _normalize_entry at load time.
     """
-    # Create a local copy to avoid modifying the original entry
-    display_entry = entry.copy()
-    
-    # For backward compatibility: parse first and last names if not present
-    if "first_name" not in display_entry or "last_name" not in display_entry:
-        if "name" in display_entry:
-            first, last = parse_name_components(display_entry["name"])
-            display_entry["first_name"] = first
-            display_entry["last_name"] = last
-    
-    display_name = get_display_name(display_entry)
+    display_name = get_display_name(entry)
     st.subheader(f"Existing calculation for '{display_name}'")
     
     # Display the first and last name separately if both exist
-    if display_entry.get("first_name") and display_entry.get("last_name"):
-        st.markdown(f"**First Name:** {display_entry['first_name']}")
-        st.markdown(f"**Last Name:** {display_entry['last_name']}")
+    if entry.get("first_name") and entry.get("last_name"):
+        st.markdown(f"**First Name:** {entry['first_name']}")
+        st.markdown(f"**Last Name:** {entry['last_name']}")
     
     col1, col2 = st.columns([1, 2])
     with col1:
-        st.metric("Numerology Value", display_entry["numerology_value"])
+        st.metric("Numerology Value", entry["numerology_value"])
     with col2:
-        st.info(f"**Meaning:** {display_entry['meaning']}")
+        st.info(f"**Meaning:** {entry['meaning']}")
     
     # Show calculation details if available
-    if "calculation" in display_entry:
+    if "calculation" in entry:
         st.markdown("**Calculation Details:**")
-        display_calculation_history(display_entry["calculation"])
+        display_calculation_history(entry["calculation"])
 
 def handle_duplicate_name(name: str) -> bool:
     """
@@ -584,22 +793,9 @@ def handle_duplicate_name(name: str) -> bool:
     
     # Ask the user if they want to view the existing calculation
     if st.button("View Existing Calculation", key="view_existing"):
-        # Find and display the existing entry
-        history = load_history()
-        name_lower = name.lower()
-        
-        for entry in history:
-            # Check if the entry matches by full name (case-insensitive)
-            if entry["name"].lower() == name_lower:
-                display_existing_calculation(entry)
-                break
-            
-            # Check if the entry matches by combined first name and last name
-            if "first_name" in entry and "last_name" in entry:
-                combined = f"{entry.get('first_name', '')} {entry.get('last_name', '')}".strip().lower()
-                if combined == name_lower:
-                    display_existing_calculation(entry)
-                    break
+        # Look up the entry matching by full name or combined first and last name
+        position = _get_history_index()[name.lower()]
+        display_existing_calculation(_get_history()[position])
     
     return True
 
@@ -6,8 +6,10 @@ A simple command-line demonstration of the numerology calculator functionality.
 """
 
 from numerology import (
+    LETTER_VALUES,
     calculate_numerology_value,
     get_numerology_meaning,
+    sum_letter_values,
     validate_name_input
 )
 
@@ -57,29 +59,10 @@ def main():
 
 def show_calculation_breakdown(name: str):
     """Show the step-by-step calculation breakdown."""
-    letter_values = {
-        'A': 1, 'J': 1, 'S': 3,
-        'B': 2, 'K': 2, 'T': 4,
-        'C': 3, 'L': 3, 'U': 6,
-        'D': 4, 'M': 4, 'V': 6,
-        'E': 5, 'N': 5, 'W': 6,
-        'F': 8, 'O': 7, 'X': 5,
-        'G': 3, 'P': 8, 'Y': 1,
-        'H': 5, 'Q': 1, 'Z': 7,
-        'I': 1, 'R': 2
-    }
-    
-    breakdown = []
-    total = 0
-    
-    for char in name.upper():
-        if char in letter_values:
-            value = letter_values[char]
-            breakdown.append(f"{char}={value}")
-            total += value
+    breakdown = [f"{char}={LETTER_VALUES[char]}" for char in name.upper() if char in LETTER_VALUES]
     
     if breakdown:
-        print(f"   Calculation: {' + '.join(breakdown)} = {total}")
+        print(f"   Calculation: {' + '.join(breakdown)} = {sum_letter_values(name)}")
 
 
 if __name__ == "__main__":
@@ -5,6 +5,126 @@ This module implements the Pythagorean numerology system for calculating
 the numerological value of names.
 """
 
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+# Pythagorean numerology letter-to-number mapping (read-only, shared by app and CLI)
+LETTER_VALUES = MappingProxyType({
+    'A': 1, 'J': 1, 'S': 3,
+    'B': 2, 'K': 2, 'T': 4,
+    'C': 3, 'L': 3, 'U': 6,
+    'D': 4, 'M': 4, 'V': 6,
+    'E': 5, 'N': 5, 'W': 6,
+    'F': 8, 'O': 7, 'X': 5,
+    'G': 3, 'P': 8, 'Y': 1,
+    'H': 5, 'Q': 1, 'Z': 7,
+    'I': 1, 'R': 2
+})
+
+# Numbers that are not reduced further
+MASTER_NUMBERS = frozenset({11, 22, 33})
+
+# Meaning of each final numerology value (read-only)
+_MEANINGS = MappingProxyType({
+    1: "Leadership, independence, pioneering spirit",
+    2: "Cooperation, balance, diplomacy",
+    3: "Creativity, communication, optimism",
+    4: "Stability, hard work, practicality",
+    5: "Freedom, adventure, versatility",
+    6: "Nurturing, responsibility, compassion",
+    7: "Spirituality, introspection, analysis",
+    8: "Material success, ambition, authority",
+    9: "Humanitarian, generous, completion",
+    11: "Intuition, inspiration, enlightenment (Master Number)",
+    22: "Master builder, practical idealism (Master Number)",
+    33: "Master teacher, compassion, healing (Master Number)"
+})
+
+# Matches any ASCII letter; for ASCII text this is exactly str.isalpha()
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+
+# Byte -> letter value table for bytes.translate; only ASCII letters (either case) are non-zero
+LETTER_LUT = bytes(LETTER_VALUES.get(chr(i).upper(), 0) if i < 128 else 0 for i in range(256))
+
+# Batches larger than this are scored in one vectorized pass when NumPy is installed
+BATCH_THRESHOLD = 50
+
+# ASCII names at least this long are scored with the JIT-compiled kernel when Numba
+# is installed; below it the kernel call costs more than bytes.translate
+JIT_MIN_LENGTH = 256
+
+
+class _Accelerators(NamedTuple):
+    """Optional NumPy and Numba helpers for long names and large batches."""
+    np: object
+    lut: object
+    score_bytes: object
+    sum_segments: object
+
+
+def _score_bytes(buf, lut):
+    # Indexed loop (rather than iterating buf) so LLVM can vectorize the reduction
+    total = 0
+    for i in range(buf.shape[0]):
+        total += lut[buf[i]]
+    return total
+
+
+def _sum_segments(buf, lut, ends, totals):
+    # Sum the letter values of each segment buf[ends[j - 1]:ends[j]] into totals[j];
+    # indexed loops (rather than iterating buf) let LLVM vectorize the inner reduction
+    start = 0
+    for j in range(ends.size):
+        total = 0
+        for i in range(start, ends[j]):
+            total += lut[buf[i]]
+        totals[j] = total
+        start = ends[j]
+
+
+@lru_cache(maxsize=None)
+def _get_accelerators() -> _Accelerators:
+    """
+    Import NumPy and Numba the first time a long name or large batch is scored.
+    
+    Importing them costs far more than scoring a typical name, so the common
+    path never pays for it. The kernels above are JIT-compiled once here.
+    
+    Returns:
+        _Accelerators: NumPy and its view of LETTER_LUT (None without NumPy)
+        and the compiled kernels (None without Numba)
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return _Accelerators(None, None, None, None)
+    
+    lut = np.frombuffer(LETTER_LUT, dtype=np.uint8)
+    try:
+        from numba import njit
+    except ImportError:
+        return _Accelerators(np, lut, None, None)
+    
+    return _Accelerators(
+        np,
+        lut,
+        njit(cache=True, boundscheck=False)(_score_bytes),
+        njit(cache=True)(_sum_segments)
+    )
+
+
+class NameScore(NamedTuple):
+    """Result of scoring a name in a single pass, as shown in the step-by-step calculation."""
+    value: int
+    total: int
+    breakdown: str
+    space_count: int
+    other_ws_count: int
+
+
 def calculate_numerology_value(name: str) -> int:
     """
     Calculate the numerology value of a name using the Pythagorean system.
@@ -26,35 +146,160 @@ def calculate_numerology_value(name: str) -> int:
     if not name or not name.strip():
         raise ValueError("Name cannot be empty")
     
-    # Pythagorean numerology letter-to-number mapping
-    letter_values = {
-        'A': 1, 'J': 1, 'S': 3,
-        'B': 2, 'K': 2, 'T': 4,
-        'C': 3, 'L': 3, 'U': 6,
-        'D': 4, 'M': 4, 'V': 6,
-        'E': 5, 'N': 5, 'W': 6,
-        'F': 8, 'O': 7, 'X': 5,
-        'G': 3, 'P': 8, 'Y': 1,
-        'H': 5, 'Q': 1, 'Z': 7,
-        'I': 1, 'R': 2
-    }
-    
-    # Convert to uppercase and calculate sum
+    # Case and whitespace do not affect the value, so variants share one cache entry
+    return _calculate_numerology_value_cached("".join(name.upper().split()))
+
+
+@lru_cache(maxsize=4096)
+def _calculate_numerology_value_cached(name: str) -> int:
+    """Calculate the numerology value of an upper-cased name without whitespace."""
+    return _final_value(sum_letter_values(name))
+
+
+@lru_cache(maxsize=4096)
+def score_name(name: str) -> NameScore:
+    """
+    Score a name and build its step-by-step breakdown in a single pass.
+    
+    The value is the same as calculate_numerology_value(name); use that when
+    the breakdown is not needed, as it is faster.
+    
+    Args:
+        name (str): The name to score
+        
+    Returns:
+        NameScore: The final value, the unreduced total, the joined
+        "A = 1 + B = 2" breakdown and the number of spaces and other
+        whitespace characters that were ignored
+        
+    Raises:
+        ValueError: If the name is empty or contains no valid letters
+    """
+    if not name or not name.strip():
+        raise ValueError("Name cannot be empty")
+    
+    breakdown = []
     total = 0
-    valid_chars = 0
+    space_count = 0
+    other_ws_count = 0
+    get = LETTER_VALUES.get
     
+    # One pass; the common case (a mapped letter) costs a single dict lookup
     for char in name.upper():
-        if char in letter_values:
-            total += letter_values[char]
-            valid_chars += 1
+        value = get(char)
+        if value is not None:
+            breakdown.append(f"{char} = {value}")
+            total += value
+        elif char == ' ':
+            space_count += 1
+        elif char.isspace():
+            other_ws_count += 1
+        elif char.isalpha():
+            # Unmapped letters are shown but do not count
+            breakdown.append(f"{char} = ?")
     
-    if valid_chars == 0:
+    return NameScore(_final_value(total), total, " + ".join(breakdown), space_count, other_ws_count)
+
+
+def _final_value(total: int) -> int:
+    """Reduce an unreduced letter total to the final value, rejecting names without valid letters."""
+    # Every letter value is at least 1, so a zero total means no valid letters
+    if total == 0:
         raise ValueError("Name must contain at least one valid letter")
     
     # Reduce to single digit or master number
     return reduce_to_final_number(total)
 
 
+def sum_letter_values(name: str) -> int:
+    """
+    Sum the letter values of a name, ignoring every other character.
+    
+    Args:
+        name (str): The name to sum letter values for
+        
+    Returns:
+        int: The unreduced total (0 if the name contains no valid letters)
+    """
+    if name.isascii():
+        data = name.encode("ascii")
+        if len(data) >= JIT_MIN_LENGTH:
+            accel = _get_accelerators()
+            if accel.score_bytes is not None:
+                return int(accel.score_bytes(accel.np.frombuffer(data, dtype=accel.np.uint8), accel.lut))
+        
+        # Translate each byte to its letter value and sum, both in C
+        return sum(data.translate(LETTER_LUT))
+    
+    # Unicode upper-casing can map non-ASCII letters onto A-Z (e.g. "ß" -> "SS")
+    return sum(LETTER_VALUES.get(char, 0) for char in name.upper())
+
+
+def calculate_numerology_values(names: list[str]) -> list[int]:
+    """
+    Calculate the numerology values of many names at once.
+    
+    Batches larger than BATCH_THRESHOLD are scored in one pass over the
+    concatenated ASCII bytes of all names when NumPy is installed, using a
+    Numba-compiled kernel if Numba is installed too. Smaller batches,
+    non-ASCII names and installs without NumPy use calculate_numerology_value.
+    
+    Args:
+        names (list[str]): The names to calculate numerology values for
+        
+    Returns:
+        list[int]: The final numerology value of each name, in order
+        
+    Raises:
+        ValueError: If any name is empty or contains no valid letters
+    """
+    if len(names) <= BATCH_THRESHOLD or _get_accelerators().np is None:
+        return [calculate_numerology_value(name) for name in names]
+    
+    # Unicode upper-casing can map non-ASCII letters onto A-Z, so only ASCII takes the byte path
+    encoded = [name.encode("ascii") if name.isascii() else None for name in names]
+    totals = iter(_sum_letter_values_batch([data for data in encoded if data is not None]))
+    
+    values = []
+    for name, data in zip(names, encoded):
+        if data is None:
+            values.append(calculate_numerology_value(name))
+            continue
+        
+        total = next(totals)
+        if total == 0:
+            # Empty or no valid letters; raise the same error as the single-name path
+            calculate_numerology_value(name)
+        values.append(reduce_to_final_number(total))
+    
+    return values
+
+
+def _sum_letter_values_batch(chunks: list[bytes]) -> list[int]:
+    """
+    Sum the letter values of each ASCII byte string in a single pass.
+    
+    Args:
+        chunks (list[bytes]): ASCII-encoded names
+        
+    Returns:
+        list[int]: The unreduced total of each name, in order
+    """
+    np, lut, _, sum_segments = _get_accelerators()
+    buf = np.frombuffer(b"".join(chunks), dtype=np.uint8)
+    lengths = np.fromiter(map(len, chunks), dtype=np.int64, count=len(chunks))
+    ends = np.cumsum(lengths)
+    
+    if sum_segments is not None:
+        totals = np.zeros(ends.size, dtype=np.int64)
+        sum_segments(buf, lut, ends, totals)
+        return totals.tolist()
+    
+    # Prefix sums of the per-byte values; each name's total is the difference at its boundaries
+    prefix = np.concatenate(([0], np.cumsum(lut[buf], dtype=np.int64)))
+    return (prefix[ends] - prefix[ends - lengths]).tolist()
+
+
 def reduce_to_final_number(number: int) -> int:
     """
     Reduce a number to a single digit (1-9) or master number (11, 22, 33).
@@ -65,21 +310,28 @@ def reduce_to_final_number(number: int) -> int:
     Returns:
         int: The reduced number
     """
-    while number > 9:
-        # Check for master numbers before reducing
-        if number in [11, 22, 33]:
-            return number
-        
-        # Sum the digits
+    if number < 10:
+        return number
+    
+    # Sum digits until the number is small enough to be a master number;
+    # typical name totals are already there or need a single step
+    while number > 33:
         digit_sum = 0
-        temp = number
-        while temp > 0:
-            digit_sum += temp % 10
-            temp //= 10
-        
+        while number:
+            digit_sum += number % 10
+            number //= 10
         number = digit_sum
     
-    return number
+    if number in MASTER_NUMBERS:
+        return number
+    
+    # One more digit sum; of 10-33 only 29 reaches a master number (11)
+    number = number // 10 + number % 10
+    if number in MASTER_NUMBERS:
+        return number
+    
+    # Closed-form digital root for what remains
+    return (number - 1) % 9 + 1
 
 
 def get_numerology_meaning(number: int) -> str:
@@ -92,22 +344,7 @@ def get_numerology_meaning(number: int) -> str:
     Returns:
         str: The meaning of the number
     """
-    meanings = {
-        1: "Leadership, independence, pioneering spirit",
-        2: "Cooperation, balance, diplomacy",
-        3: "Creativity, communication, optimism",
-        4: "Stability, hard work, practicality",
-        5: "Freedom, adventure, versatility",
-        6: "Nurturing, responsibility, compassion",
-        7: "Spirituality, introspection, analysis",
-        8: "Material success, ambition, authority",
-        9: "Humanitarian, generous, completion",
-        11: "Intuition, inspiration, enlightenment (Master Number)",
-        22: "Master builder, practical idealism (Master Number)",
-        33: "Master teacher, compassion, healing (Master Number)"
-    }
-    
-    return meanings.get(number, "Unknown number")
+    return _MEANINGS.get(number, "Unknown number")
 
 
 def validate_name_input(name: str) -> tuple[bool, str]:
@@ -120,11 +357,15 @@ def validate_name_input(name: str) -> tuple[bool, str]:
     Returns:
         tuple[bool, str]: (is_valid, error_message)
     """
-    if not name or not name.strip():
+    if not name or name.isspace():
         return False, "Please enter a name"
     
-    # Check if name contains at least one letter
-    has_letter = any(char.isalpha() for char in name)
+    # Check if name contains at least one letter; the regex search runs in C
+    # and stops at the first match
+    if name.isascii():
+        has_letter = _ASCII_LETTER_RE.search(name) is not None
+    else:
+        has_letter = any(char.isalpha() for char in name)
     if not has_letter:
         return False, "Name must contain at least one letter"
     
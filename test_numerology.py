@@ -4,13 +4,25 @@ Test module for the numerology calculator.
 Simple tests to verify the numerology calculations work correctly.
 """
 
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
 from numerology import (
     calculate_numerology_value,
+    calculate_numerology_values,
+    BATCH_THRESHOLD,
+    JIT_MIN_LENGTH,
     reduce_to_final_number,
+    score_name,
+    sum_letter_values,
     get_numerology_meaning,
     validate_name_input
 )
 
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
 
 def test_basic_calculations():
     """Test basic numerology calculations."""
@@ -46,6 +58,16 @@ def test_number_reduction():
     assert reduce_to_final_number(22) == 22
     assert reduce_to_final_number(33) == 33
     
+    # Master numbers reached partway through the reduction
+    assert reduce_to_final_number(38) == 11
+    assert reduce_to_final_number(47) == 11
+    assert reduce_to_final_number(2999) == 11
+    assert reduce_to_final_number(499) == 22
+    
+    # Sums that pass through 10
+    assert reduce_to_final_number(19) == 1
+    assert reduce_to_final_number(55) == 1
+    
     print("✅ Number reduction test passed!")
 
 
@@ -119,19 +141,190 @@ def test_whitespace_handling():
     print("✅ Whitespace handling test passed!")
 
 
+def test_long_names():
+    """Test that long names (JIT path when Numba is installed) score like short ones."""
+    print("Testing long names...")
+    
+    repeats = JIT_MIN_LENGTH // len("John Doe") + 1
+    assert sum_letter_values("John Doe" * repeats) == sum_letter_values("John Doe") * repeats, \
+        "Long names should sum the same letter values"
+    assert sum_letter_values(" \t" * JIT_MIN_LENGTH) == 0, "Long whitespace should score zero"
+    
+    print("✅ Long names test passed!")
+
+
+def test_batch_calculations():
+    """Test that batch calculation matches the single-name path."""
+    print("Testing batch calculations...")
+    
+    names = ["JOHN", "mary jane", "J\tO H N", "Zoë", "MICHAEL", "jennifer"]
+    
+    # Small batch (pure Python path)
+    expected = [calculate_numerology_value(name) for name in names]
+    assert calculate_numerology_values(names) == expected, "Batch should match single-name results"
+    
+    # Large batch (vectorized path when NumPy is installed)
+    many = names * (BATCH_THRESHOLD // len(names) + 1)
+    assert calculate_numerology_values(many) == expected * (len(many) // len(names)), \
+        "Large batch should match single-name results"
+    
+    # Invalid names raise like the single-name path
+    for bad in (["JOHN", "123"], ["JOHN", "123"] * BATCH_THRESHOLD):
+        try:
+            calculate_numerology_values(bad)
+            assert False, "Batch with an invalid name should raise ValueError"
+        except ValueError:
+            pass
+    
+    print("✅ Batch calculations test passed!")
+
+
+def test_score_name():
+    """Test the single-pass score with breakdown."""
+    print("Testing score_name...")
+    
+    score = score_name("Jo\thn Doe")
+    assert score.breakdown == "J = 1 + O = 7 + H = 5 + N = 5 + D = 4 + O = 7 + E = 5", \
+        f"Unexpected breakdown: {score.breakdown}"
+    assert score.total == 34, f"Expected total 34, got {score.total}"
+    assert (score.space_count, score.other_ws_count) == (1, 1), "Should count ignored whitespace"
+    
+    for name in ["JOHN", "mary jane", "J\tO H N", "Zoë", "MICHAEL", "jennifer"]:
+        assert score_name(name).value == calculate_numerology_value(name), \
+            f"score_name should match calculate_numerology_value for {name!r}"
+    
+    for bad in ["", "   ", "123"]:
+        try:
+            score_name(bad)
+            assert False, f"score_name({bad!r}) should raise ValueError"
+        except ValueError:
+            pass
+    
+    print("✅ score_name test passed!")
+
+
+@contextmanager
+def app_workdir():
+    """Run the Streamlit app from an empty temporary directory with fresh caches."""
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+    
+    # Caches are per process, so results from another directory must not leak in
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            yield lambda: AppTest.from_file(APP_FILE, default_timeout=30)
+        finally:
+            os.chdir(cwd)
+
+
+def test_history_legacy_migration():
+    """Test that a legacy JSON history is migrated to JSON Lines and still detects duplicates."""
+    print("Testing legacy history migration...")
+    
+    with app_workdir() as new_app:
+        # Legacy entries have no first_name/last_name fields
+        with open("calculation_history.json", "w", encoding="utf-8") as f:
+            json.dump([{"timestamp": "t", "name": "Old Name", "numerology_value": 3, "meaning": "m"}], f, indent=2)
+        
+        at = new_app().run()
+        assert not at.exception, f"App raised: {at.exception}"
+        assert os.listdir(".") == ["calculation_history.jsonl"], \
+            f"Legacy file should be replaced by JSON Lines, found {os.listdir('.')}"
+        with open("calculation_history.jsonl", encoding="utf-8") as f:
+            assert [json.loads(line)["name"] for line in f] == ["Old Name"], "Entry should be migrated"
+        
+        # Duplicate detection ignores case against the migrated entry
+        at.text_input[0].input("OLD")
+        at.text_input[1].input("name")
+        at.button(key="calculate_button").click().run()
+        assert any("already in your calculation history" in w.value for w in at.warning), \
+            "Migrated entry should be detected as a duplicate"
+    
+    print("✅ Legacy history migration test passed!")
+
+
+def test_history_bad_legacy_file():
+    """Test that an unreadable legacy history is kept as a .bak file and not migrated."""
+    print("Testing bad legacy history files...")
+    
+    for content in ['[{"timestamp": "t", "name": "Old', '{}', '["Old Name"]']:
+        with app_workdir() as new_app:
+            with open("calculation_history.json", "w", encoding="utf-8") as f:
+                f.write(content)
+            
+            at = new_app().run()
+            assert not at.exception, f"App raised for {content!r}: {at.exception}"
+            assert os.listdir(".") == ["calculation_history.json.bak"], \
+                f"{content!r} should be kept as .bak without a JSON Lines file, found {os.listdir('.')}"
+            with open("calculation_history.json.bak", encoding="utf-8") as f:
+                assert f.read() == content, "Backup should keep the original contents"
+    
+    print("✅ Bad legacy history files test passed!")
+
+
+def test_history_skips_bad_lines():
+    """Test that torn and non-object history lines are skipped without losing the rest."""
+    print("Testing history with bad lines...")
+    
+    with app_workdir() as new_app:
+        with open("calculation_history.jsonl", "w", encoding="utf-8") as f:
+            f.write('5\n[]\nnull\n')
+            f.write('{"timestamp":"t","name":"Jane Roe","numerology_value":2,"meaning":"m"}\n')
+            f.write('{"timestamp":"t2","name":"Torn')
+        
+        at = new_app().run()
+        assert not at.exception, f"App raised: {at.exception}"
+        assert list(at.dataframe[0].value["Name"]) == ["Jane Roe"], "Only the valid entry should be shown"
+    
+    print("✅ History with bad lines test passed!")
+
+
+def test_history_sees_other_sessions():
+    """Test that entries appended by another session appear after this session saves."""
+    print("Testing history shared between sessions...")
+    
+    with app_workdir() as new_app:
+        at = new_app().run()
+        at.text_input[0].input("John")
+        at.text_input[1].input("Doe")
+        at.button(key="calculate_button").click().run()
+        
+        # Another session appends an entry; bump the mtime past the filesystem's resolution
+        with open("calculation_history.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"timestamp":"t","name":"Other Session","numerology_value":2,"meaning":"m"}\n')
+        mtime = os.path.getmtime("calculation_history.jsonl")
+        os.utime("calculation_history.jsonl", (mtime + 2, mtime + 2))
+        
+        at.text_input[0].input("Mary")
+        at.text_input[1].input("")
+        at.button(key="calculate_button").click().run()
+        assert not at.exception, f"App raised: {at.exception}"
+        assert sorted(at.dataframe[0].value["Name"]) == ["John Doe", "Mary", "Other Session"], \
+            "History should include the other session's entry"
+    
+    print("✅ History shared between sessions test passed!")
+
+
 def run_sample_calculations():
     """Run some sample calculations to demonstrate the system."""
     print("\n=== Sample Calculations ===")
     
     sample_names = ["JOHN", "MARY", "DAVID", "SARAH", "MICHAEL", "JENNIFER"]
     
-    for name in sample_names:
-        try:
-            value = calculate_numerology_value(name)
-            meaning = get_numerology_meaning(value)
-            print(f"{name:10} = {value:2} | {meaning}")
-        except Exception as e:
-            print(f"Error calculating {name}: {e}")
+    try:
+        values = calculate_numerology_values(sample_names)
+    except Exception as e:
+        print(f"Error calculating sample names: {e}")
+        return
+    
+    for name, value in zip(sample_names, values):
+        meaning = get_numerology_meaning(value)
+        print(f"{name:10} = {value:2} | {meaning}")
 
 
 if __name__ == "__main__":
@@ -144,6 +337,13 @@ if __name__ == "__main__":
         test_validation()
         test_meanings()
         test_whitespace_handling()
+        test_long_names()
+        test_batch_calculations()
+        test_score_name()
+        test_history_legacy_migration()
+        test_history_bad_legacy_file()
+        test_history_skips_bad_lines()
+        test_history_sees_other_sessions()
         
         print("\n🎉 All tests passed!")
         